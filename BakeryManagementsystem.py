@@ -1,82 +1,488 @@
+import numpy as np
 import pandas as pd
+import atexit
+import bisect
+import collections
+import csv
+import hashlib
+import hmac
+import importlib.util
+import io
+import mmap
 import os
+import queue
+import re
+import threading
+import time
 from datetime import datetime
 
+_USER_HASH = hashlib.sha256(b'admin').digest()
+_PASS_HASH = hashlib.sha256(b'password').digest()
+
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+_POS_INT_RE = re.compile(r'0*[1-9][0-9]*')
+_DATE_FMT = "%Y-%m-%d"
+# New quantities are capped so the column fits in uint16.
+_MAX_QUANTITY = np.iinfo(np.uint16).max
+
+_COLUMNS = ["Order ID", "Customer Name", "Order", "Quantity", "Order Date"]
+# Explicit schema so read_csv skips type inference; Order Date is kept as
+# datetime64 in memory so date filters compare int64s.
+_DTYPES = {"Order ID": np.int64, "Customer Name": "string", "Order": "string", "Quantity": np.int64}
+_READ_KW = dict(engine='c', dtype=_DTYPES, parse_dates=["Order Date"], date_format=_DATE_FMT)
+
+# Orders buffered before they are merged into the DataFrame in one concat.
+_PENDING_MAX = 64
+
+# Opt-in polars CSV reader/writer; pandas stays the default. polars is only
+# imported when asked for, so it costs nothing at startup otherwise.
+_FAST_IO = os.environ.get("BAKERY_FAST_IO") == "1"
+if _FAST_IO:
+    try:
+        import polars as pl
+    except ImportError:
+        _FAST_IO = False
+
+# Below this many rows the NumPy filter wins over paying for JIT compilation.
+_JIT_MIN_ROWS = 100_000
+
+# numba is only imported, and the kernel compiled, the first time a table is
+# big enough to use it; see _load_filter_kernel().
+_HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+_filter_kernel = None
+
+
+def _load_filter_kernel():
+    global _filter_kernel
+    if _filter_kernel is not None:
+        return _filter_kernel
+    from numba import njit, prange
+
+    # Fused name-substring and date-range filter. Names are the lower-cased
+    # _name_lc array viewed as code points, one zero-padded row per order;
+    # dates are day ordinals.
+    @njit(parallel=True, cache=True)
+    def kernel(names, dates_i, pat, d0, d1, out):
+        m = len(pat)
+        for i in prange(names.shape[0]):
+            ok = d0 <= dates_i[i] <= d1
+            if ok and m > 0:
+                ok = False
+                for j in range(names.shape[1] - m + 1):
+                    k = 0
+                    while k < m and names[i, j + k] == pat[k]:
+                        k += 1
+                    if k == m:
+                        ok = True
+                        break
+            out[i] = ok
+
+    _filter_kernel = kernel
+    return kernel
+
+
+def _orders_frame(rows):
+    df = pd.DataFrame(rows, columns=_COLUMNS).astype(_DTYPES)
+    # Files written before the cap may hold quantities outside uint16; those
+    # keep the int64 column rather than wrap.
+    quantity = df["Quantity"]
+    if ((quantity > 0) & (quantity <= _MAX_QUANTITY)).all():
+        df["Quantity"] = quantity.astype(np.uint16)
+    df["Order Date"] = pd.to_datetime(df["Order Date"], format=_DATE_FMT)
+    return df
+
+
+def _fast_read_csv(path):
+    if _FAST_IO:
+        # Read every column as text: inferring from the first rows breaks on a
+        # name column that starts out numeric. _orders_frame() does the casts.
+        return _orders_frame(pl.read_csv(path, infer_schema=False).to_pandas())
+    # parse_dates leaves a header-only file's date column as object, which
+    # _fast_to_csv's .dt accessor cannot handle.
+    return _orders_frame(pd.read_csv(path, **_READ_KW))
+
+
+def _fast_to_csv(df, path):
+    df = df.assign(**{"Order Date": df["Order Date"].dt.strftime(_DATE_FMT)})
+    if _FAST_IO:
+        pl.from_pandas(df).write_csv(path)
+    else:
+        df.to_csv(path, index=False)
+
+
+_MENU = """
+Bakery Management System
+1. Add Order
+2. Update Order
+3. Delete Order
+4. Lookup Order
+5. Filter Orders
+6. Export Orders to CSV
+7. Backup Orders
+8. Restore Orders
+9. Order Summary
+10. Exit"""
+
+
+# Runs file writes on one background thread, in the order they were submitted,
+# so disk I/O overlaps with waiting for the next menu input.
+class _AsyncWriter:
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._error = None
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception as e:
+                # Keep the first failure; later ones are usually its fallout.
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._queue.task_done()
+
+    def submit(self, fn, *args):
+        self._queue.put((fn, args))
+
+    def join(self):
+        self._queue.join()
+        self.check()
+
+    def check(self):
+        # Raise a failure from a job that has already finished, without waiting
+        # for the rest of the queue.
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        self._queue.put(None)
+
+
 class BakeryManagementSystem:
     def __init__(self, filename='bakery_orders.csv'):
         self.filename = filename
-        if os.path.exists(self.filename):
-            self.orders = pd.read_csv(self.filename)
-            if not self.orders.empty:
-                self.next_order_id = self.orders["Order ID"].max() + 1
-            else:
-                self.next_order_id = 1
-        else:
-            self.orders = pd.DataFrame(columns=["Order ID", "Customer Name", "Order", "Quantity", "Order Date"])
-            self.next_order_id = 1
+        # Not read until something needs the whole table; see _as_df().
+        self.orders = None
+        # Order IDs as stored in the CSV, read at startup, plus a read-only map of
+        # the file with each row's span, made on the first lookup_order before the
+        # DataFrame is loaded. The map is dropped whenever the file changes.
+        self._row_ids = None
+        self._ids_sorted = False
+        self._appended_ids = []
+        self._mm = None
+        self._row_starts = None
+        self._row_ends = None
         self.log_filename = 'bakery_log.txt'
         self.backup_filename = 'bakery_orders_backup.csv'
+        # Orders added since the DataFrame was last built; they are already on disk.
+        self._pending = []
+        # Order ID -> row position in self.orders as of the last _reindex(); see _row_pos().
+        self._id_to_idx = {}
+        # Sorted _id_to_idx positions of rows deleted since the last _reindex().
+        self._tombstones = []
+        # Lower-cased customer names as a contiguous str array for filter_orders.
+        # Built on first use, then kept in step with merges, renames and deletes.
+        self._name_lc = None
+        # Row positions sorted by Order Date, so date ranges are two binary searches.
+        # Built on first use, then kept in step like _name_lc.
+        self._date_order = None
+        # Set by updates/deletes; the full rewrite is deferred to _maybe_flush().
+        self._dirty = False
+        self._last_save = time.monotonic()
+        write_header = not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0
+        self._open_csv()
+        if write_header:
+            self._writer.writerow(_COLUMNS)
+            self._csv_fh.flush()
+        self._log_fh = open(self.log_filename, 'a', buffering=1 << 15)
+        self._log_buf = io.StringIO()
+        # Timestamp shared by every log line of one menu action; set by menu().
+        self._tick = None
+        self._io = _AsyncWriter()
+        atexit.register(self.flush)
+        self._read_ids()
+        self.next_order_id = int(self._row_ids.max()) + 1 if len(self._row_ids) else 1
+        # Menu choice -> handler; '10' (exit) is handled by menu() itself.
+        self._dispatch = {
+            '1': lambda: self.add_order(*self._read_add_inputs()),
+            '2': lambda: self.update_order(*self._read_update_inputs()),
+            '3': lambda: self.delete_order(int(input("Enter order ID to delete: "))),
+            '4': lambda: self.lookup_order(int(input("Enter order ID to lookup: "))),
+            '5': lambda: self.filter_orders(*self._read_filter_inputs()),
+            '6': lambda: self.export_orders_to_csv(input("Enter filename to export to (e.g., orders.csv): ")),
+            '7': self.backup_orders,
+            '8': self.restore_orders,
+            '9': self.order_summary,
+        }
+
+    def _open_csv(self):
+        # A hand-edited file may not end in a newline; _append_row adds one
+        # first so the new row does not run on from the last line.
+        self._needs_newline = False
+        if os.path.exists(self.filename) and os.path.getsize(self.filename) > 0:
+            with open(self.filename, 'rb') as fh:
+                fh.seek(-1, os.SEEK_END)
+                self._needs_newline = fh.read(1) != b'\n'
+        self._csv_fh = open(self.filename, 'a', newline='', buffering=1 << 16)
+        self._writer = csv.writer(self._csv_fh, lineterminator=os.linesep)
+
+    def _read_ids(self):
+        self._row_ids = pd.read_csv(self.filename, usecols=["Order ID"], engine='c',
+                                    dtype={"Order ID": np.int64})["Order ID"].to_numpy()
+        # The file is user-editable, so only binary-search it when the IDs
+        # really are strictly ascending.
+        self._ids_sorted = bool(np.all(self._row_ids[1:] > self._row_ids[:-1]))
+
+    def _map_csv(self):
+        self._io.join()
+        # Orders added since startup are on disk now; each took next_order_id,
+        # so the IDs stay ascending.
+        if self._appended_ids:
+            self._row_ids = np.concatenate([self._row_ids, self._appended_ids])
+            self._appended_ids.clear()
+        with open(self.filename, 'rb') as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = np.frombuffer(self._mm, dtype=np.uint8)
+        ends = np.flatnonzero(buf == 0x0A)
+        if self._mm[-1:] != b'\n':
+            ends = np.append(ends, len(self._mm))
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        # Data rows only: skip the header and any blank lines.
+        starts, ends = starts[1:], ends[1:]
+        width = ends - starts
+        keep = (width > 1) | ((width == 1) & (buf[np.minimum(starts, len(buf) - 1)] != 0x0D))
+        self._row_starts = starts[keep]
+        self._row_ends = ends[keep]
+        # Rows the ID read and this scan disagree on: leave it to _load().
+        if len(self._row_starts) != len(self._row_ids):
+            self._ids_sorted = False
+
+    def _unmap_csv(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+            self._row_starts = None
+            self._row_ends = None
+
+    def _find_row(self, order_id):
+        i = self._row_ids.searchsorted(order_id)
+        if i < len(self._row_ids) and self._row_ids[i] == order_id:
+            a, b = int(self._row_starts[i]), int(self._row_ends[i])
+            return next(csv.reader([self._mm[a:b].decode().rstrip('\r')]))
+        return None
+
+    def _load(self):
+        self._io.join()
+        self._unmap_csv()
+        self._row_ids = None
+        self._appended_ids.clear()
+        self.orders = _fast_read_csv(self.filename)
+        self._col_pos = {c: i for i, c in enumerate(self.orders.columns)}
+        if not self.orders.empty:
+            self.next_order_id = max(self.next_order_id, int(self.orders["Order ID"].max()) + 1)
+        self._reindex()
+        self._recount()
+
+    def _reindex(self):
+        self._id_to_idx = {int(r): i for i, r in enumerate(self.orders["Order ID"].to_numpy())}
+        self._tombstones = []
+
+    def _row_pos(self, order_id):
+        p = self._id_to_idx.get(order_id)
+        if p is None:
+            return None
+        return p - bisect.bisect_left(self._tombstones, p)
+
+    def _recount(self):
+        self._total_qty = int(self.orders["Quantity"].sum())
+        self._order_counts = collections.Counter(self.orders["Order"].tolist())
+
+    def _uncount(self, order, quantity):
+        self._total_qty -= quantity
+        self._order_counts[order] -= 1
+        if self._order_counts[order] <= 0:
+            del self._order_counts[order]
+
+    def _as_df(self):
+        if self.orders is None:
+            self._load()
+        if self._pending:
+            for i, row in enumerate(self._pending, start=len(self.orders) + len(self._tombstones)):
+                self._id_to_idx[row[0]] = i
+            new_orders = _orders_frame(self._pending)
+            if self.orders.empty:
+                self.orders = new_orders
+            else:
+                self.orders = pd.concat([self.orders, new_orders], ignore_index=True)
+            if self._name_lc is not None:
+                added = np.array([str(row[1]).lower() for row in self._pending], dtype=str)
+                self._name_lc = np.concatenate([self._name_lc, added])
+            start = len(self.orders) - len(new_orders)
+            self._date_index_insert(np.arange(start, len(self.orders)), new_orders["Order Date"].to_numpy())
+            self._pending.clear()
+        return self.orders
+
+    def _date_index_insert(self, positions, dates):
+        if self._date_order is None:
+            return
+        by_date = np.argsort(dates, kind='stable')
+        at = self._dates_sorted.searchsorted(dates[by_date], 'right')
+        self._date_order = np.insert(self._date_order, at, positions[by_date])
+        self._dates_sorted = np.insert(self._dates_sorted, at, dates[by_date])
+
+    def _date_index_remove(self, idx, date):
+        if self._date_order is None:
+            return
+        lo = self._dates_sorted.searchsorted(date, 'left')
+        hi = self._dates_sorted.searchsorted(date, 'right')
+        k = lo + np.flatnonzero(self._date_order[lo:hi] == idx)[0]
+        self._date_order = np.delete(self._date_order, k)
+        self._dates_sorted = np.delete(self._dates_sorted, k)
 
     def save_orders(self):
-        self.orders.to_csv(self.filename, index=False)
+        self._flush_log()
+        # update_order edits self.orders in place, so hand the writer a snapshot.
+        self._io.submit(self._rewrite_csv, self._as_df().copy())
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    def _rewrite_csv(self, orders):
+        tmp = self.filename + '.tmp'
+        _fast_to_csv(orders, tmp)
+        # Windows refuses to replace a file that is still open.
+        self._csv_fh.close()
+        try:
+            os.replace(tmp, self.filename)
+        finally:
+            self._open_csv()
+
+    def _append_row(self, row):
+        if self._needs_newline:
+            self._csv_fh.write(os.linesep)
+            self._needs_newline = False
+        self._writer.writerow(row)
+        self._csv_fh.flush()
+
+    def _write_log(self, text):
+        self._log_fh.write(text)
+        self._log_fh.flush()
+
+    def _maybe_flush(self, force=False):
+        if self._dirty and (force or time.monotonic() - self._last_save > 1.0):
+            self.save_orders()
+
+    def _flush_log(self):
+        text = self._log_buf.getvalue()
+        if text:
+            self._io.submit(self._write_log, text)
+            self._log_buf.seek(0)
+            self._log_buf.truncate()
+
+    def flush(self):
+        self._maybe_flush(force=True)
+        self._flush_log()
+        self._io.join()
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+        self._io.close()
+        self._unmap_csv()
+        self._log_fh.close()
+        self._csv_fh.close()
 
     def validate_date(self, date_str):
+        m = _DATE_RE.fullmatch(date_str)
+        if not m:
+            return False
+        y, mo, d = map(int, m.groups())
+        if not (y >= 1 and 1 <= mo <= 12 and 1 <= d <= 31):
+            return False
+        if d < 29:
+            return True
+        # Only the last days of a month need the calendar check.
         try:
-            datetime.strptime(date_str, "%Y-%m-%d")
+            datetime(y, mo, d)
             return True
         except ValueError:
             return False
 
     def validate_quantity(self, quantity):
-        return quantity.isdigit() and int(quantity) > 0
+        return _POS_INT_RE.fullmatch(quantity) is not None and int(quantity) <= _MAX_QUANTITY
 
     def log_action(self, action):
-        with open(self.log_filename, 'a') as log_file:
-            log_file.write(f"{datetime.now()} - {action}\n")
+        tick = self._tick or datetime.now().isoformat(timespec='seconds')
+        self._log_buf.write(f"{tick} - {action}\n")
+        if self._log_buf.tell() > 8192:
+            self._flush_log()
 
     def send_notification(self, message):
         print(f"Notification: {message}")
 
     def add_order(self, name, order, quantity, order_date):
         if not self.validate_quantity(quantity):
-            print("Invalid quantity. Please enter a positive integer.")
+            print(f"Invalid quantity. Please enter a positive integer up to {_MAX_QUANTITY}.")
             return
         if not self.validate_date(order_date):
             print("Invalid date format. Please enter the date in YYYY-MM-DD format.")
             return
 
-        new_order = pd.DataFrame({
-            "Order ID": [self.next_order_id],
-            "Customer Name": [name],
-            "Order": [order],
-            "Quantity": [int(quantity)],
-            "Order Date": [order_date]
-        })
-        self.orders = pd.concat([self.orders, new_order], ignore_index=True)
-        self.save_orders()
+        row = (self.next_order_id, name, order, np.uint16(int(quantity)), order_date)
+        self._io.submit(self._append_row, row)
+        if self.orders is None:
+            # _load() will read the row back from the file.
+            self._unmap_csv()
+            self._appended_ids.append(row[0])
+        else:
+            self._pending.append(row)
+            if len(self._pending) >= _PENDING_MAX:
+                self._as_df()
+            self._total_qty += int(quantity)
+            self._order_counts[order] += 1
         self.log_action(f"Added order ID: {self.next_order_id}")
         self.send_notification(f"New order added: {name}, {order}, {quantity}, {order_date}")
         print(f"Order added successfully with order ID: {self.next_order_id}")
         self.next_order_id += 1
 
     def update_order(self, order_id, name=None, order=None, quantity=None, order_date=None):
-        idx = self.orders.index[self.orders["Order ID"] == order_id].tolist()
-        if idx:
+        self._as_df()
+        idx = self._row_pos(order_id)
+        if idx is not None:
             if name:
-                self.orders.at[idx[0], "Customer Name"] = name
+                self.orders.iat[idx, self._col_pos["Customer Name"]] = name
+                # A longer name than the array's fixed width would be truncated.
+                lowered = name.lower()
+                if self._name_lc is not None and len(lowered) <= self._name_lc.itemsize // 4:
+                    self._name_lc[idx] = lowered
+                else:
+                    self._name_lc = None
             if order:
-                self.orders.at[idx[0], "Order"] = order
+                self._uncount(self.orders.iat[idx, self._col_pos["Order"]], 0)
+                self._order_counts[order] += 1
+                self.orders.iat[idx, self._col_pos["Order"]] = order
             if quantity:
                 if not self.validate_quantity(quantity):
-                    print("Invalid quantity. Please enter a positive integer.")
+                    print(f"Invalid quantity. Please enter a positive integer up to {_MAX_QUANTITY}.")
                     return
-                self.orders.at[idx[0], "Quantity"] = int(quantity)
+                self._total_qty += int(quantity) - int(self.orders.iat[idx, self._col_pos["Quantity"]])
+                self.orders.iat[idx, self._col_pos["Quantity"]] = int(quantity)
             if order_date:
                 if not self.validate_date(order_date):
                     print("Invalid date format. Please enter the date in YYYY-MM-DD format.")
                     return
-                self.orders.at[idx[0], "Order Date"] = order_date
-            self.save_orders()
+                new_date = pd.Timestamp(order_date)
+                self._date_index_remove(idx, self.orders.iat[idx, self._col_pos["Order Date"]].to_datetime64())
+                self._date_index_insert(np.array([idx]), np.array([new_date.to_datetime64()]))
+                self.orders.iat[idx, self._col_pos["Order Date"]] = new_date
+            self._dirty = True
+            self._maybe_flush()
             self.log_action(f"Updated order ID: {order_id}")
             self.send_notification(f"Order updated: {order_id}, {name}, {order}, {quantity}, {order_date}")
             print(f"Order ID {order_id} updated successfully.")
@@ -84,10 +490,25 @@ class BakeryManagementSystem:
             print(f"Order ID {order_id} not found.")
 
     def delete_order(self, order_id):
-        idx = self.orders.index[self.orders["Order ID"] == order_id].tolist()
-        if idx:
-            self.orders = self.orders.drop(idx)
-            self.save_orders()
+        self._as_df()
+        idx = self._row_pos(order_id)
+        if idx is not None:
+            order = self.orders.iat[idx, self._col_pos["Order"]]
+            quantity = int(self.orders.iat[idx, self._col_pos["Quantity"]])
+            self._uncount(order, quantity)
+            self._date_index_remove(idx, self.orders.iat[idx, self._col_pos["Order Date"]].to_datetime64())
+            if self._date_order is not None:
+                self._date_order[self._date_order > idx] -= 1
+            self.orders = self.orders.drop(idx).reset_index(drop=True)
+            # Renumbering the map is a pass over every row, so only do it once the
+            # deleted rows' tombstones pass a tenth of the table.
+            bisect.insort(self._tombstones, self._id_to_idx.pop(order_id))
+            if len(self._tombstones) > len(self.orders) // 10:
+                self._reindex()
+            if self._name_lc is not None:
+                self._name_lc = np.delete(self._name_lc, idx)
+            self._dirty = True
+            self._maybe_flush()
             self.log_action(f"Deleted order ID: {order_id}")
             self.send_notification(f"Order deleted: {order_id}")
             print(f"Order ID {order_id} deleted successfully.")
@@ -95,38 +516,98 @@ class BakeryManagementSystem:
             print(f"Order ID {order_id} not found.")
 
     def lookup_order(self, order_id):
-        order = self.orders[self.orders["Order ID"] == order_id]
-        if not order.empty:
-            print(order.to_string(index=False))
+        if self.orders is None and self._mm is None:
+            self._map_csv()
+        if self.orders is None and self._ids_sorted:
+            # Parse just the one row instead of loading the whole file.
+            row = self._find_row(order_id)
+            if row is not None:
+                print(_orders_frame([row]).to_string(index=False))
+            else:
+                print(f"Order ID {order_id} not found.")
+            return
+        orders = self._as_df()
+        idx = self._row_pos(order_id)
+        if idx is not None:
+            print(orders.iloc[[idx]].to_string(index=False))
         else:
             print(f"Order ID {order_id} not found.")
 
     def filter_orders(self, customer_name=None, start_date=None, end_date=None):
-        filtered_orders = self.orders
-        if customer_name:
-            filtered_orders = filtered_orders[filtered_orders["Customer Name"].str.contains(customer_name, case=False, na=False)]
-        if start_date:
-            filtered_orders = filtered_orders[filtered_orders["Order Date"] >= start_date]
-        if end_date:
-            filtered_orders = filtered_orders[filtered_orders["Order Date"] <= end_date]
+        for date_str in (start_date, end_date):
+            if date_str and not self.validate_date(date_str):
+                print("Invalid date format. Please enter the date in YYYY-MM-DD format.")
+                return
+        orders = self._as_df()
+        if _HAVE_NUMBA and len(orders) >= _JIT_MIN_ROWS:
+            mask = self._jit_mask(orders, customer_name, start_date, end_date)
+        else:
+            mask = self._np_mask(orders, customer_name, start_date, end_date)
+        filtered_orders = orders.iloc[mask]
         if filtered_orders.empty:
             print("No orders found.")
         else:
             print(filtered_orders.to_string(index=False))
 
+    def _names_lc(self, orders):
+        if self._name_lc is None:
+            names = orders["Customer Name"].fillna("").astype(str).str.lower()
+            self._name_lc = names.to_numpy(dtype=str)
+        return self._name_lc
+
+    def _jit_mask(self, orders, customer_name, start_date, end_date):
+        names_lc = self._names_lc(orders)
+        names = names_lc.view(np.uint32).reshape(len(orders), names_lc.itemsize // 4)
+        dates_i = orders["Order Date"].to_numpy().astype("datetime64[D]").view(np.int64)
+        # An empty str array still holds one (zero) code point, so no name means no pattern.
+        pat = (np.array([customer_name.lower()], dtype=str).view(np.uint32) if customer_name
+               else np.empty(0, dtype=np.uint32))
+        d0 = np.datetime64(start_date, "D").view(np.int64) if start_date else np.iinfo(np.int64).min
+        d1 = np.datetime64(end_date, "D").view(np.int64) if end_date else np.iinfo(np.int64).max
+        mask = np.empty(len(orders), dtype=bool)
+        _load_filter_kernel()(names, dates_i, pat, d0, d1, mask)
+        return mask
+
+    def _np_mask(self, orders, customer_name, start_date, end_date):
+        mask = np.ones(len(orders), dtype=bool)
+        if customer_name:
+            mask &= np.char.find(self._names_lc(orders), customer_name.lower()) >= 0
+        if start_date or end_date:
+            if self._date_order is None:
+                dates = orders["Order Date"].to_numpy()
+                self._date_order = np.argsort(dates, kind='stable')
+                self._dates_sorted = dates[self._date_order]
+            lo = 0
+            hi = len(self._dates_sorted)
+            if start_date:
+                lo = self._dates_sorted.searchsorted(np.datetime64(start_date), 'left')
+            if end_date:
+                hi = self._dates_sorted.searchsorted(np.datetime64(end_date), 'right')
+            in_range = np.zeros(len(orders), dtype=bool)
+            in_range[self._date_order[lo:hi]] = True
+            mask &= in_range
+        return mask
+
     def export_orders_to_csv(self, filename):
-        self.orders.to_csv(filename, index=False)
+        _fast_to_csv(self._as_df(), filename)
         self.log_action(f"Exported orders to {filename}")
         print(f"All orders have been exported to {filename}")
 
     def backup_orders(self):
-        self.orders.to_csv(self.backup_filename, index=False)
+        _fast_to_csv(self._as_df(), self.backup_filename)
         self.log_action("Backup orders")
         print(f"Backup created successfully at {self.backup_filename}")
 
     def restore_orders(self):
         if os.path.exists(self.backup_filename):
-            self.orders = pd.read_csv(self.backup_filename)
+            self.orders = _fast_read_csv(self.backup_filename)
+            self._col_pos = {c: i for i, c in enumerate(self.orders.columns)}
+            self._pending.clear()
+            self._unmap_csv()
+            self._reindex()
+            self._recount()
+            self._name_lc = None
+            self._date_order = None
             self.save_orders()
             self.next_order_id = self.orders["Order ID"].max() + 1
             self.log_action("Restored orders from backup")
@@ -137,9 +618,11 @@ class BakeryManagementSystem:
     def order_summary(self):
         print("Order Summary")
         print("-------------")
-        total_orders = len(self.orders)
-        total_quantity = self.orders["Quantity"].sum()
-        most_popular_order = self.orders["Order"].mode()[0] if total_orders > 0 else "None"
+        if self.orders is None:
+            self._load()
+        total_orders = len(self.orders) + len(self._pending)
+        total_quantity = self._total_qty
+        most_popular_order = self._order_counts.most_common(1)[0][0] if self._order_counts else "None"
         print(f"Total Orders: {total_orders}")
         print(f"Total Quantity: {total_quantity}")
         print(f"Most Popular Order: {most_popular_order}")
@@ -147,65 +630,56 @@ class BakeryManagementSystem:
     def authenticate_user(self):
         username = input("Enter username: ")
         password = input("Enter password: ")
-        return username == "admin" and password == "password"
+        # Bitwise & so both digests are always compared.
+        return (hmac.compare_digest(hashlib.sha256(username.encode()).digest(), _USER_HASH)
+                & hmac.compare_digest(hashlib.sha256(password.encode()).digest(), _PASS_HASH))
+
+    def _read_add_inputs(self):
+        name = input("Enter customer name: ")
+        order = input("Enter order: ")
+        quantity = input("Enter quantity: ")
+        order_date = input("Enter order date (YYYY-MM-DD): ")
+        return name, order, quantity, order_date
+
+    def _read_update_inputs(self):
+        order_id = int(input("Enter order ID to update: "))
+        name = input("Enter new customer name (leave blank to keep unchanged): ")
+        order = input("Enter new order (leave blank to keep unchanged): ")
+        quantity = input("Enter new quantity (leave blank to keep unchanged): ")
+        order_date = input("Enter new order date (YYYY-MM-DD) (leave blank to keep unchanged): ")
+        return order_id, name or None, order or None, quantity or None, order_date or None
+
+    def _read_filter_inputs(self):
+        customer_name = input("Enter customer name to filter by (leave blank to ignore): ")
+        start_date = input("Enter start date (YYYY-MM-DD) to filter by (leave blank to ignore): ")
+        end_date = input("Enter end date (YYYY-MM-DD) to filter by (leave blank to ignore): ")
+        return customer_name or None, start_date or None, end_date or None
 
     def menu(self):
         if not self.authenticate_user():
             print("Authentication failed. Exiting system.")
+            self.close()
             return
 
+        dispatch = self._dispatch
         while True:
-            print("\nBakery Management System")
-            print("1. Add Order")
-            print("2. Update Order")
-            print("3. Delete Order")
-            print("4. Lookup Order")
-            print("5. Filter Orders")
-            print("6. Export Orders to CSV")
-            print("7. Backup Orders")
-            print("8. Restore Orders")
-            print("9. Order Summary")
-            print("10. Exit")
-
+            # Report a failed background write before the user carries on.
+            try:
+                self._io.check()
+            except Exception as e:
+                print(f"Error: failed to write to disk: {e}")
+            print(_MENU)
             choice = input("Enter your choice: ")
-
-            if choice == '1':
-                name = input("Enter customer name: ")
-                order = input("Enter order: ")
-                quantity = input("Enter quantity: ")
-                order_date = input("Enter order date (YYYY-MM-DD): ")
-                self.add_order(name, order, quantity, order_date)
-            elif choice == '2':
-                order_id = int(input("Enter order ID to update: "))
-                name = input("Enter new customer name (leave blank to keep unchanged): ")
-                order = input("Enter new order (leave blank to keep unchanged): ")
-                quantity = input("Enter new quantity (leave blank to keep unchanged): ")
-                order_date = input("Enter new order date (YYYY-MM-DD) (leave blank to keep unchanged): ")
-                self.update_order(order_id, name or None, order or None, quantity or None, order_date or None)
-            elif choice == '3':
-                order_id = int(input("Enter order ID to delete: "))
-                self.delete_order(order_id)
-            elif choice == '4':
-                order_id = int(input("Enter order ID to lookup: "))
-                self.lookup_order(order_id)
-            elif choice == '5':
-                customer_name = input("Enter customer name to filter by (leave blank to ignore): ")
-                start_date = input("Enter start date (YYYY-MM-DD) to filter by (leave blank to ignore): ")
-                end_date = input("Enter end date (YYYY-MM-DD) to filter by (leave blank to ignore): ")
-                self.filter_orders(customer_name or None, start_date or None, end_date or None)
-            elif choice == '6':
-                filename = input("Enter filename to export to (e.g., orders.csv): ")
-                self.export_orders_to_csv(filename)
-            elif choice == '7':
-                self.backup_orders()
-            elif choice == '8':
-                self.restore_orders()
-            elif choice == '9':
-                self.order_summary()
-            elif choice == '10':
+            self._tick = datetime.now().isoformat(timespec='seconds')
+            self._maybe_flush()
+            if choice == '10':
+                self.close()
                 break
-            else:
+            action = dispatch.get(choice)
+            if action is None:
                 print("Invalid choice, please try again.")
+                continue
+            action()
 
 if __name__ == "__main__":
     system = BakeryManagementSystem()